@@ -8,30 +8,124 @@ def send_message_script():
     """Utility commands for orchestrating repeating Nighty messages."""
 
     import asyncio
-    from dataclasses import dataclass
-    from typing import Dict, Optional
+    import atexit
+    import heapq
+    import itertools
+    import logging
+    import logging.handlers
+    import math
+    import queue
+    import re
+    from dataclasses import dataclass, field
+    from functools import lru_cache
+    from types import MappingProxyType
+    from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+    log = logging.getLogger("message_scheduler")
+    if not log.handlers:
+        class NightyConsoleHandler(logging.Handler):
+            """Writes records to the Nighty console, which stays visible when stderr isn't."""
+
+            def emit(self, record: logging.LogRecord) -> None:
+                try:
+                    message = self.format(record)
+                    try:
+                        print(message, type_="ERROR")
+                    except TypeError:
+                        # Plain print outside Nighty.
+                        print(message)
+                except Exception:
+                    self.handleError(record)
+
+        # Records go through a queue so a burst of send failures never blocks the
+        # event loop on console I/O; a listener thread does the actual writing.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        console_handler = NightyConsoleHandler()
+        console_handler.setFormatter(
+            logging.Formatter("[Message Scheduler] %(levelname)s: %(message)s")
+        )
+        log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+        log_listener.start()
+        atexit.register(log_listener.stop)
+        log.addHandler(logging.handlers.QueueHandler(log_queue))
+        log.setLevel(logging.WARNING)
+        log.propagate = False
 
     # ---------------------------------------------------------------------
     # Data models & helpers
     # ---------------------------------------------------------------------
-    @dataclass
+    @dataclass(slots=True)
     class ScheduledTask:
         name: str
         channel_id: int
         delay: float
         message: str
-
-        def to_config(self) -> Dict[str, str]:
-            return {
+        # Runtime-only channel handle; never written to the config.
+        channel: Optional[object] = field(default=None, repr=False, compare=False)
+        # Runtime caches; slots need them declared up front.
+        _cfg: Dict[str, object] = field(init=False, repr=False, compare=False)
+        _send: object = field(init=False, repr=False, compare=False)
+
+        def __post_init__(self) -> None:
+            # Serialized once so saving never rebuilds unchanged entries.
+            self._cfg = {
                 "channel_id": self.channel_id,
                 "delay": self.delay,
                 "message": self.message,
             }
+            # Bound ``channel.send`` so the dispatcher skips the attribute lookup.
+            self._send = None if self.channel is None else self.channel.send
+
+        def bind(self, channel) -> None:
+            self.channel = channel
+            self._send = channel.send
+
+        def to_config(self) -> Dict[str, str]:
+            return self._cfg
 
     class TaskManager:
+        # Seconds to wait after a mutation so bursts collapse into one write.
+        SAVE_DELAY = 0.25
+        # Largest window `.batchwindow` accepts.
+        MAX_BATCH_WINDOW = 60.0
+        BATCH_SEPARATOR = "\n---\n"
+        # Discord rejects messages longer than this, so batches never grow past it.
+        MESSAGE_LIMIT = 2000
+        # Discord's per-channel send bucket: CHANNEL_RATE messages every CHANNEL_PER seconds.
+        CHANNEL_RATE = 5
+        CHANNEL_PER = 5.0
+        # Shortest allowed period: one send per refill interval of the channel bucket.
+        MIN_DELAY = CHANNEL_PER / CHANNEL_RATE
+
         def __init__(self):
-            self.running: Dict[str, asyncio.Task] = {}
+            # name -> deadline of its live heap entry; anything else in the heap is stale.
+            self.running: Dict[str, float] = {}
             self.tasks: Dict[str, ScheduledTask] = self._load_tasks()
+            self._tasks_view = MappingProxyType(self.tasks)
+            # Opt-in via `.batchwindow`: sends to one channel due within this many seconds
+            # go out as one message. 0 disables batching.
+            self.batch_window: float = self._load_batch_window()
+            self._serialized: Dict[str, dict] = {
+                name: task.to_config() for name, task in self.tasks.items()
+            }
+            self._dirty = asyncio.Event()
+            self._pending = False
+            self._flusher: Optional[asyncio.Task] = None
+            # (deadline, sequence, name); the sequence keeps ties in FIFO order.
+            self._heap: List[Tuple[float, int, str]] = []
+            self._sequence = itertools.count()
+            self._loop: Optional[asyncio.AbstractEventLoop] = None
+            # Future the dispatcher is parked on; resolving it wakes the dispatcher early.
+            self._waiter: Optional[asyncio.Future] = None
+            self._dispatcher: Optional[asyncio.Task] = None
+            # name -> its send that hasn't finished yet
+            self._sending: Dict[str, asyncio.Task] = {}
+            self._bot = None
+            # channel_id -> (tokens, last refill time)
+            self._buckets: Dict[int, Tuple[float, float]] = {}
+            # Rendered .listtasks lines, invalidated whenever a task changes.
+            self._render_cache: Dict[str, str] = {}
+            self._list_cache: Optional[str] = None
 
         # --------------------------- persistence ---------------------------
         def _load_tasks(self) -> Dict[str, ScheduledTask]:
@@ -40,10 +134,13 @@ def send_message_script():
             tasks: Dict[str, ScheduledTask] = {}
             for name, raw in stored.items():
                 try:
+                    delay = float(raw["delay"])
+                    if not math.isfinite(delay):
+                        raise ValueError(delay)
                     tasks[name] = ScheduledTask(
                         name=name,
                         channel_id=int(raw["channel_id"]),
-                        delay=float(raw["delay"]),
+                        delay=delay,
                         message=str(raw["message"]),
                     )
                 except (KeyError, TypeError, ValueError):
@@ -51,69 +148,304 @@ def send_message_script():
                     continue
             return tasks
 
-        def save(self) -> None:
-            updateConfigData(
-                "active_tasks",
-                {name: task.to_config() for name, task in self.tasks.items()},
+        def _load_batch_window(self) -> float:
+            try:
+                window = float(getConfigData().get("batch_window") or 0)
+            except (TypeError, ValueError):
+                return 0.0
+            return window if 0 <= window <= self.MAX_BATCH_WINDOW else 0.0
+
+        async def set_batch_window(self, seconds: float) -> None:
+            self.batch_window = seconds
+            await asyncio.get_running_loop().run_in_executor(
+                None, updateConfigData, "batch_window", seconds
             )
 
+        def save(self) -> None:
+            updateConfigData("active_tasks", self._serialized)
+
+        def mark_dirty(self) -> None:
+            self._pending = True
+            self._dirty.set()
+            if self._flusher is None or self._flusher.done():
+                self._flusher = asyncio.create_task(self._flush_loop())
+
+        def flush(self) -> None:
+            if self._pending:
+                self._pending = False
+                self.save()
+
+        async def _flush_loop(self) -> None:
+            loop = asyncio.get_running_loop()
+            while True:
+                await self._dirty.wait()
+                self._dirty.clear()
+                await asyncio.sleep(self.SAVE_DELAY)
+                if not self._pending:
+                    continue
+                self._pending = False
+                # Write from a worker thread so disk I/O doesn't stall the event loop.
+                # The shallow copy keeps the worker from seeing the dict change mid-dump.
+                try:
+                    await loop.run_in_executor(
+                        None, updateConfigData, "active_tasks", dict(self._serialized)
+                    )
+                except Exception:  # pragma: no cover - runtime safeguard
+                    # Keep the change pending so the next mutation or exit retries it.
+                    self._pending = True
+                    log.exception("Could not save scheduled tasks")
+
         # ---------------------------- runtime -----------------------------
-        async def start(self, ctx, task: ScheduledTask) -> None:
-            channel = ctx.bot.get_channel(task.channel_id)
+        async def start(self, bot, task: ScheduledTask, *, persist: bool = True) -> None:
+            if not math.isfinite(task.delay) or not task.delay >= self.MIN_DELAY:
+                # Shorter periods can only ever be throttled, and keep the dispatcher busy.
+                raise ValueError(f"Delay must be at least {self.MIN_DELAY:g} seconds.")
+
+            channel = bot.get_channel(task.channel_id)
             if channel is None:
                 raise ValueError(
                     f"Channel `{task.channel_id}` is not accessible. Try re-inviting the bot or checking permissions."
                 )
 
-            async def send_loop():
-                while True:
-                    try:
-                        await channel.send(task.message)
-                    except Exception as exc:  # pragma: no cover - runtime safeguard
-                        print(f"[{task.name}] Error sending message: {exc}")
-                    await asyncio.sleep(task.delay)
-
-            if task.name in self.running:
-                self.running[task.name].cancel()
+            # A send left over from a previous task under this name must not post.
+            self._drop_send(task.name)
 
-            loop_task = asyncio.create_task(send_loop())
-            self.running[task.name] = loop_task
+            self._bot = bot
+            if self._loop is None:
+                self._loop = asyncio.get_running_loop()
+            deadline = self._loop.time()
+            self.running[task.name] = deadline
+            task.bind(channel)
+            heapq.heappush(self._heap, (deadline, next(self._sequence), task.name))
             self.tasks[task.name] = task
-            self.save()
+            self._serialized[task.name] = task.to_config()
+            self._invalidate(task.name)
+            if persist:
+                self.mark_dirty()
+
+            if self._waiter is not None:
+                self._release(self._waiter)
+            if self._dispatcher is None or self._dispatcher.done():
+                self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+        async def _dispatch_loop(self) -> None:
+            # One coroutine drives every task from a heap of (deadline, sequence, name) entries.
+            loop = self._loop
+            # Bind everything the loop touches per tick to locals.
+            heap, running, tasks = self._heap, self.running, self.tasks
+            heappop, heappush, time, deliver = heapq.heappop, heapq.heappush, loop.time, self._deliver
+            create_future, call_later, release = loop.create_future, loop.call_later, self._release
+            collect, sequence = self._collect_batch, self._sequence
+            sending, sleep = self._sending, asyncio.sleep
+            while True:
+                due = False
+                if heap:
+                    deadline, _, name = heap[0]
+                    now = time()
+                    due = deadline <= now
+                if not due:
+                    # Park on a bare future: call_later resolves it when the head entry is
+                    # due, and start() resolves it early when it pushes something new.
+                    waiter = self._waiter = create_future()
+                    handle = call_later(deadline - now, release, waiter) if heap else None
+                    await waiter
+                    if handle is not None:
+                        handle.cancel()
+                    continue
+
+                heappop(heap)
+                if running.get(name) != deadline:
+                    # Stopped or restarted since this entry was pushed.
+                    continue
+
+                task = tasks[name]
+                batch = [(deadline, task)]
+                # While the previous send is still waiting on the rate limit, skip this
+                # tick rather than build a backlog. Other tasks are left in the heap untouched.
+                if name not in sending:
+                    # Read every tick so `.batchwindow` applies without a restart.
+                    batch_window = self.batch_window
+                    if batch_window > 0:
+                        batch += collect(task, now + batch_window)
+                    deliver(batch)
+
+                # Advance from the deadline so the period doesn't drift; resync if we fell behind.
+                for queued_deadline, queued in batch:
+                    next_due = max(queued_deadline + queued.delay, now)
+                    running[queued.name] = next_due
+                    heappush(heap, (next_due, next(sequence), queued.name))
+
+                # Yield after every due entry so no schedule can starve the rest of the host.
+                await sleep(0)
+
+        def _collect_batch(self, first: ScheduledTask, horizon: float) -> List[Tuple[float, ScheduledTask]]:
+            # Pop live, idle entries due before `horizon` that share first's channel and still fit.
+            heap, running, sending = self._heap, self.running, self._sending
+            batch: List[Tuple[float, ScheduledTask]] = []
+            deferred: List[Tuple[float, int, str]] = []
+            size = len(first.message)
+            while heap and heap[0][0] <= horizon:
+                entry = heapq.heappop(heap)
+                deadline, _, name = entry
+                if running.get(name) != deadline:
+                    continue
+
+                task = self.tasks[name]
+                extra = len(self.BATCH_SEPARATOR) + len(task.message)
+                if (
+                    task.channel_id == first.channel_id
+                    and name not in sending
+                    and size + extra <= self.MESSAGE_LIMIT
+                ):
+                    size += extra
+                    batch.append((deadline, task))
+                else:
+                    deferred.append(entry)
+
+            for entry in deferred:
+                heapq.heappush(heap, entry)
+            return batch
+
+        def _deliver(self, batch: List[Tuple[float, ScheduledTask]]) -> None:
+            members = [queued for _, queued in batch]
+            # Sends run on their own so one slow request can't hold up the schedule.
+            job = asyncio.create_task(self._send_limited(members))
+            # Every batched task is busy until the shared send finishes.
+            for queued in members:
+                self._sending[queued.name] = job
+                job.add_done_callback(lambda done, queued=queued: self._sent(queued, done))
+
+        async def _send_limited(self, members: List[ScheduledTask]) -> None:
+            await self._acquire(members[0].channel_id)
+            # Join only now, so members stopped while waiting on the bucket are left out.
+            job = asyncio.current_task()
+            live = [task for task in members if self._sending.get(task.name) is job]
+            if not live:
+                return
+            if len(live) == 1:
+                message = live[0].message
+            else:
+                message = self.BATCH_SEPARATOR.join(task.message for task in live)
+            await live[0]._send(message)
+
+        async def _acquire(self, channel_id: int) -> None:
+            # Token bucket matching Discord's limit, so we wait here instead of eating 429 retries.
+            rate, per = self.CHANNEL_RATE, self.CHANNEL_PER
+            loop = self._loop
+            while True:
+                now = loop.time()
+                tokens, last = self._buckets.get(channel_id, (rate, now))
+                tokens = min(rate, tokens + (now - last) * rate / per)
+                if tokens >= 1:
+                    self._buckets[channel_id] = (tokens - 1, now)
+                    return
+                self._buckets[channel_id] = (tokens, now)
+                await asyncio.sleep((1 - tokens) * per / rate)
+
+        @staticmethod
+        def _release(waiter: asyncio.Future) -> None:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        def _sent(self, task: ScheduledTask, job: asyncio.Task) -> None:
+            if self._sending.get(task.name) is not job:
+                # Stopped or replaced since it was spawned; the current task isn't affected.
+                return
+
+            del self._sending[task.name]
+            if job.cancelled() or job.exception() is None:
+                return
+
+            log.error("[%s] Error sending message", task.name, exc_info=job.exception())
+            # The cached channel may be stale (e.g. after a reconnect); resolve it again.
+            channel = self._bot.get_channel(task.channel_id)
+            if channel is not None:
+                task.bind(channel)
+
+        async def restore_all(self, bot) -> None:
+            pending = [task for name, task in self.tasks.items() if name not in self.running]
+            results = await asyncio.gather(
+                *(self.start(bot, task, persist=False) for task in pending),
+                return_exceptions=True,
+            )
+            for task, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    log.warning("[%s] Could not restore task: %s", task.name, result)
+
+        def _drop_send(self, name: str) -> None:
+            job = self._sending.pop(name, None)
+            # A batched send is shared; only cancel it once no other member still needs it.
+            # Otherwise _send_limited leaves this task's message out of the joined text.
+            if job is not None and job not in self._sending.values():
+                job.cancel()
 
         def stop(self, name: str) -> bool:
-            stopped = False
-            task = self.running.pop(name, None)
-            if task:
-                task.cancel()
-                stopped = True
+            # Dropping the deadline turns the task's heap entry into a tombstone.
+            stopped = self.running.pop(name, None) is not None
+            # Stop a send that is still in flight so stopping takes effect immediately.
+            self._drop_send(name)
 
-            if name in self.tasks:
-                self.tasks.pop(name, None)
-                self.save()
+            if self.tasks.pop(name, None) is not None:
+                self._invalidate(name)
                 stopped = True
+                # Only rewrite the config when the persisted table actually changed.
+                if self._serialized.pop(name, None) is not None:
+                    self.mark_dirty()
 
             return stopped
 
+        def _invalidate(self, name: str) -> None:
+            self._render_cache.pop(name, None)
+            self._list_cache = None
+
+        def render_list(self) -> str:
+            if self._list_cache is None:
+                cache = self._render_cache
+                for name, task in self.tasks.items():
+                    if name not in cache:
+                        cache[name] = (
+                            f"**{task.name}** • {format_delay(task.delay)} • <#{task.channel_id}>"
+                        )
+                self._list_cache = "\n".join(cache[name] for name in self.tasks)
+            return self._list_cache
+
         def get(self, name: str) -> Optional[ScheduledTask]:
             return self.tasks.get(name)
 
-        def list(self) -> Dict[str, ScheduledTask]:
-            return dict(self.tasks)
+        def list(self) -> Mapping[str, ScheduledTask]:
+            # Read-only live view; callers only iterate, so there is nothing to copy.
+            return self._tasks_view
 
     manager = TaskManager()
+    # Persist anything still waiting on the debounce window at shutdown.
+    atexit.register(manager.flush)
 
     INFO_ICON = ":information_source:"
     SUCCESS_ICON = ":white_check_mark:"
     WARNING_ICON = ":warning:"
     ERROR_ICON = ":x:"
+    FOOTER_TEXT = "Message Scheduler — try `.sendmessages help`"
+
+    background_jobs: Set[asyncio.Task] = set()
+
+    def fire_and_forget(coro) -> None:
+        # Hold a reference until the job finishes; the loop only keeps weak ones.
+        job = asyncio.create_task(coro)
+        background_jobs.add(job)
+        job.add_done_callback(forget_job)
+
+    def forget_job(job: asyncio.Task) -> None:
+        background_jobs.discard(job)
+        if not job.cancelled():
+            # Retrieve the exception so it isn't reported as never retrieved.
+            job.exception()
 
     def build_message(
         *,
         title: str,
         body: str = "",
         highlights: Optional[Dict[str, str]] = None,
-        footer: Optional[str] = "Message Scheduler — try `.sendmessages help`",
+        footer: Optional[str] = FOOTER_TEXT,
         icon: str = INFO_ICON,
     ) -> str:
         lines = [f"{icon} **{title}**"]
@@ -124,13 +456,13 @@ def send_message_script():
 
         if highlights:
             for name, value in highlights.items():
-                value_lines = str(value).splitlines() or [""]
-                if len(value_lines) == 1:
-                    lines.append(f"> **{name}:** {value_lines[0]}")
-                else:
-                    lines.append(f"> **{name}:**")
-                    for line in value_lines:
-                        lines.append(f"> {line}")
+                text = value if type(value) is str else str(value)
+                if "\n" not in text:
+                    # Most highlights are a single line; skip building a line list.
+                    lines.append(f"> **{name}:** {text}")
+                    continue
+                lines.append(f"> **{name}:**")
+                lines.extend(f"> {line}" for line in text.splitlines())
 
         if footer:
             lines.append("")
@@ -138,6 +470,8 @@ def send_message_script():
 
         return "\n".join(lines)
 
+    # Delays come from a handful of user-typed values, so renders mostly hit the cache.
+    @lru_cache(maxsize=256)
     def format_delay(seconds: float) -> str:
         seconds = float(seconds)
         if seconds < 60:
@@ -148,65 +482,66 @@ def send_message_script():
         hours, minutes = divmod(minutes, 60)
         return f"{int(hours)}h {int(minutes)}m"
 
-    def parse_definition(args: str) -> ScheduledTask:
-        # Expected format: <name>, """<message>""", <channel>, <delay_seconds>
-        if "," not in args:
-            raise ValueError(
-                "Format: <name>, \"\"\"<message>\"\"\", <channel>, <delay_seconds>"
-            )
-
-        name_token, remainder = args.split(",", 1)
-        name = name_token.strip().strip('"')
-        remainder = remainder.lstrip()
-
-        if not remainder.startswith('"""'):
-            raise ValueError('Message must be wrapped in triple quotes (""" ... """).')
-
-        end_index = remainder.find('"""', 3)
-        if end_index == -1:
-            raise ValueError('Message must be wrapped in triple quotes (""" ... """).')
-
-        message = remainder[3:end_index]
-        remainder = remainder[end_index + 3 :].lstrip()
-
-        if not remainder.startswith(","):
-            raise ValueError(
-                "Format: <name>, \"\"\"<message>\"\"\", <channel>, <delay_seconds>"
-            )
+    # <name>, """<message>""", <channel>, <delay_seconds> in a single pass.
+    DEFINITION_PATTERN = re.compile(
+        r'^\s*"?(?P<name>[^",\s][^",]*?)"?\s*,\s*"""(?P<message>.*?)"""\s*,'
+        r'\s*(?P<mention><#)?(?P<channel>\d+)(?(mention)>)\s*,\s*(?P<delay>[+-]?[\d.]+(?:[eE][+-]?\d+)?)\s*$',
+        re.DOTALL,
+    )
 
-        remainder = remainder[1:].lstrip()
-        parts = [part.strip() for part in remainder.split(",", 1)]
-        if len(parts) != 2:
+    def parse_definition(args: str) -> ScheduledTask:
+        match = DEFINITION_PATTERN.match(args)
+        if not match:
+            if '"""' not in args:
+                raise ValueError('Message must be wrapped in triple quotes (""" ... """).')
             raise ValueError(
                 "Format: <name>, \"\"\"<message>\"\"\", <channel>, <delay_seconds>"
             )
 
-        channel_token, delay_token = parts
-        if channel_token.startswith("<#") and channel_token.endswith(">"):
-            channel_token = channel_token[2:-1]
-
-        delay = float(delay_token)
+        try:
+            delay = float(match["delay"])
+        except ValueError:
+            raise ValueError(f"Delay `{match['delay']}` is not a number of seconds.") from None
+        if not math.isfinite(delay):
+            raise ValueError("Delay is too large.")
+        if delay < TaskManager.MIN_DELAY:
+            raise ValueError(f"Delay must be at least {TaskManager.MIN_DELAY:g} seconds.")
 
         return ScheduledTask(
-            name=name,
-            channel_id=int(channel_token),
+            name=match["name"],
+            channel_id=int(match["channel"]),
             delay=delay,
-            message=message,
+            message=match["message"],
         )
 
+    # The help text never changes, so render it once at load time.
+    HELP_MESSAGE = build_message(
+        title="Message Scheduler Help",
+        body="Here are the available commands:",
+        highlights={
+            "Commands": "\n".join(
+                [
+                    "`.sendmessages <name>, \"\"\"<message>\"\"\", <channel>, <delay_seconds>`",
+                    "`.stoptask <name>`",
+                    "`.listtasks`",
+                    "`.taskinfo <name>`",
+                    "`.batchwindow <seconds>`",
+                ]
+            )
+        },
+        icon=INFO_ICON,
+    )
+
     def help_message() -> str:
-        lines = [
-            "`.sendmessages <name>, \"\"\"<message>\"\"\", <channel>, <delay_seconds>`",
-            "`.stoptask <name>`",
-            "`.listtasks`",
-            "`.taskinfo <name>`",
-        ]
-        return build_message(
-            title="Message Scheduler Help",
-            body="Here are the available commands:",
-            highlights={"Commands": "\n".join(lines)},
-            icon=INFO_ICON,
-        )
+        return HELP_MESSAGE
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+    @bot.listen("on_ready")
+    async def restore_tasks():
+        # Persisted tasks are only loaded into memory; resume their loops here.
+        await manager.restore_all(bot)
 
     # ------------------------------------------------------------------
     # Commands
@@ -216,9 +551,10 @@ def send_message_script():
         description="Starts sending a repeating message to a channel.",
     )
     async def start_send(ctx, *, args: str = ""):
-        await ctx.message.delete()
+        fire_and_forget(ctx.message.delete())
 
-        if not args.strip() or args.strip().lower() in {"help", "?"}:
+        stripped = args.strip()
+        if not stripped or stripped.lower() in {"help", "?"}:
             return await ctx.send(help_message(), delete_after=20)
 
         try:
@@ -239,7 +575,7 @@ def send_message_script():
                 )
                 return await ctx.send(message, delete_after=15)
 
-            await manager.start(ctx, task)
+            await manager.start(ctx.bot, task)
 
             preview = (task.message[:150] + "…") if len(task.message) > 150 else task.message
             preview_block = f"```{preview}```" if preview else "(message is empty)"
@@ -265,7 +601,7 @@ def send_message_script():
 
     @bot.command(name="stoptask", description="Stops a running sendmessages task.")
     async def stop_task(ctx, *, name: str = ""):
-        await ctx.message.delete()
+        fire_and_forget(ctx.message.delete())
 
         if not name.strip():
             message = build_message(
@@ -291,31 +627,24 @@ def send_message_script():
 
     @bot.command(name="listtasks", description="Lists all active message tasks.")
     async def list_tasks(ctx):
-        await ctx.message.delete()
+        fire_and_forget(ctx.message.delete())
 
-        tasks = manager.list()
-        if not tasks:
+        if not manager.list():
             message = build_message(
                 title="No active tasks",
                 body="Use `.sendmessages` to start one.",
             )
             return await ctx.send(message, delete_after=12)
 
-        description_lines = []
-        for task in tasks.values():
-            description_lines.append(
-                f"**{task.name}** • {format_delay(task.delay)} • <#{task.channel_id}>"
-            )
-
         message = build_message(
             title="Active message tasks",
-            body="\n".join(description_lines),
+            body=manager.render_list(),
         )
         await ctx.send(message, delete_after=20)
 
     @bot.command(name="taskinfo", description="Shows message contents for a scheduled task.")
     async def task_info(ctx, *, name: str = ""):
-        await ctx.message.delete()
+        fire_and_forget(ctx.message.delete())
 
         if not name.strip():
             message = build_message(
@@ -348,6 +677,54 @@ def send_message_script():
         )
         await ctx.send(message, delete_after=30)
 
+    @bot.command(
+        name="batchwindow",
+        description="Merges sends to the same channel that fall due close together.",
+    )
+    async def batch_window(ctx, *, seconds: str = ""):
+        fire_and_forget(ctx.message.delete())
+
+        current = f"{manager.batch_window:g} seconds" if manager.batch_window else "off"
+        if not seconds.strip():
+            message = build_message(
+                title="Batch window",
+                body="Usage: `.batchwindow <seconds>` (`0` turns batching off)",
+                highlights={"Current": current},
+            )
+            return await ctx.send(message, delete_after=15)
+
+        try:
+            window = float(seconds)
+        except ValueError:
+            window = -1.0
+        if not 0 <= window <= TaskManager.MAX_BATCH_WINDOW:
+            message = build_message(
+                title="Invalid batch window",
+                body=f"Use a number of seconds from 0 to {TaskManager.MAX_BATCH_WINDOW:g}.",
+                highlights={"Current": current},
+                icon=WARNING_ICON,
+            )
+            return await ctx.send(message, delete_after=15)
+
+        await manager.set_batch_window(window)
+        if window:
+            body = f"Sends to one channel due within {window:g} seconds now go out as one message."
+        else:
+            body = "Every task now sends its own message."
+        message = build_message(
+            title="Batching enabled" if window else "Batching disabled",
+            body=body,
+            icon=SUCCESS_ICON,
+        )
+        await ctx.send(message, delete_after=15)
+
+    if bot.is_ready():
+        # Loaded after login (e.g. a script reload), so on_ready won't fire until the
+        # next reconnect. Scripts may load off the event loop thread, so hand the
+        # restore to the bot's loop; restore_all skips running tasks, so both paths
+        # are safe. Done last so a failure here can't cost the commands above.
+        asyncio.run_coroutine_threadsafe(manager.restore_all(bot), bot.loop)
+
 
 # Register the script
 send_message_script()